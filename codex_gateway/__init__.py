@@ -6,14 +6,33 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:  # pragma: no cover
     from fastapi import FastAPI
 
+    from .cli import main
+    from .doctor import run_doctor
+    from .openai_compat import ChatCompletionRequest, ChatMessage
+
     app: FastAPI
 
-__all__ = ["app"]
+# Public name -> (submodule, attribute). Everything is imported lazily so environment
+# variables can be loaded before `codex_gateway.server` (and thus `codex_gateway.config`)
+# is imported, and so CLI use of the package never pulls in FastAPI.
+_LAZY: dict[str, tuple[str, str]] = {
+    "app": (".server", "app"),
+    "main": (".cli", "main"),
+    "run_doctor": (".doctor", "run_doctor"),
+    "ChatMessage": (".openai_compat", "ChatMessage"),
+    "ChatCompletionRequest": (".openai_compat", "ChatCompletionRequest"),
+}
+
+__all__ = ["app", "main", "run_doctor", "ChatMessage", "ChatCompletionRequest"]
 
 
 def __getattr__(name: str):
-    # Lazily import the FastAPI app so environment variables can be loaded
-    # before `codex_gateway.server` (and thus `codex_gateway.config`) is imported.
-    if name == "app":
-        return import_module(".server", __name__).app
-    raise AttributeError(name)
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(name) from None
+    return getattr(import_module(module, __name__), attr)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -3,8 +3,6 @@ import os
 import sys
 from pathlib import Path
 
-import uvicorn
-
 
 def _normalize_provider(raw: str | None) -> str | None:
     if not raw:
@@ -20,24 +18,29 @@ def _normalize_provider(raw: str | None) -> str | None:
 
 
 def _maybe_load_dotenv(path: Path) -> None:
-    if not path.exists() or not path.is_file():
+    try:
+        data = path.read_bytes()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
         return
-    for raw_line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+    environ = os.environ
+    for raw_line in data.decode("utf-8", "ignore").splitlines():
         line = raw_line.strip()
-        if not line or line.startswith("#"):
+        if not line or line[0] == "#":
             continue
         if line.startswith("export "):
-            line = line[len("export ") :].strip()
+            line = line[len("export ") :].lstrip()
         key, sep, value = line.partition("=")
         if not sep:
             continue
-        key = key.strip()
-        value = value.strip()
-        if not key:
+        # `line` is already stripped, so only the inner edges of key/value need trimming.
+        key = key.rstrip()
+        # Never clobber existing env; skip before doing any work on the value.
+        if not key or key in environ:
             continue
-        if value and value[0] in {"'", '"'} and value[-1] == value[0]:
+        value = value.lstrip()
+        if value[:1] in {"'", '"'} and value[-1] == value[0]:
             value = value[1:-1]
-        os.environ.setdefault(key, value)
+        environ[key] = value
 
 
 def _default_env_candidates() -> list[Path]:
@@ -49,6 +52,12 @@ def _default_env_candidates() -> list[Path]:
 
 
 def build_parser() -> argparse.ArgumentParser:
+    env = os.environ
+    default_host = env.get("CODEX_HOST", "127.0.0.1")
+    default_port = int(env.get("CODEX_PORT", "8000"))
+    default_log_level = env.get("CODEX_LOG_LEVEL", "info")
+    default_preset = env.get("CODEX_PRESET")
+
     parser = argparse.ArgumentParser(
         prog="agent-cli-to-api",
         description="Expose agent CLIs as an OpenAI-compatible /v1 API gateway.",
@@ -61,12 +70,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--host",
-        default=os.environ.get("CODEX_HOST", "127.0.0.1"),
+        default=default_host,
         help="Bind host (default: 127.0.0.1).",
     )
     parser.add_argument(
         "--port",
-        default=int(os.environ.get("CODEX_PORT", "8000")),
+        default=default_port,
         type=int,
         help="Bind port (default: 8000).",
     )
@@ -77,7 +86,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--log-level",
-        default=os.environ.get("CODEX_LOG_LEVEL", "info"),
+        default=default_log_level,
         help="Uvicorn log level (default: info).",
     )
     parser.add_argument(
@@ -87,7 +96,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--preset",
-        default=os.environ.get("CODEX_PRESET"),
+        default=default_preset,
         help="Optional config preset (sets recommended env defaults).",
     )
     parser.add_argument(
@@ -188,6 +197,9 @@ def main(argv: list[str] | None = None) -> None:
     except Exception:
         pass
 
+    # Deferred so `--help`, bad args and `doctor` don't pay for uvicorn's import graph.
+    import uvicorn
+
     uvicorn.run(
         "codex_gateway.server:app",
         host=args.host,
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-import asyncio
 import os
 import shutil
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from .claude_oauth import maybe_refresh_claude_oauth
-from .codex_responses import load_codex_auth
-from .gemini_cloudcode import load_gemini_creds
+# Provider modules (and asyncio) are imported inside the functions that need them, so
+# importing doctor for its helpers stays cheap and a single-provider run doesn't load
+# every provider's auth stack.
+
+_TRUE: frozenset[str] = frozenset({"1", "true", "yes", "y", "on"})
+_FALSE: frozenset[str] = frozenset({"0", "false", "no", "n", "off"})
+_KNOWN_PROVIDERS: frozenset[str] = frozenset({"auto", "codex", "gemini", "claude", "cursor-agent"})
 
 
 def _parse_env_bool(name: str, default: bool = False) -> tuple[bool, str | None]:
@@ -23,9 +26,9 @@ def _parse_env_bool(name: str, default: bool = False) -> tuple[bool, str | None]
     v = raw.strip().lower()
     if not v:
         return default, None
-    if v in {"1", "true", "yes", "y", "on"}:
+    if v in _TRUE:
         return True, None
-    if v in {"0", "false", "no", "n", "off"}:
+    if v in _FALSE:
         return False, None
     return default, f"invalid boolean value {raw!r} (expected one of 1/0 true/false yes/no on/off)"
 
@@ -34,14 +37,14 @@ def _normalize_provider(raw: str | None) -> str:
     p = (raw or "").strip().lower()
     if not p:
         return "auto"
-    if p in {"auto", "codex", "gemini", "claude", "cursor-agent"}:
+    if p in _KNOWN_PROVIDERS:
         return p
     if p in {"cursor", "cursoragent", "cursor_agent"}:
         return "cursor-agent"
     return "auto"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckResult:
     name: str
     ok: bool
@@ -65,7 +68,12 @@ def _check_binary(label: str, bin_name: str, *, required: bool) -> CheckResult:
 
 
 def _check_codex_auth(*, required: bool) -> CheckResult:
-    auth = load_codex_auth(codex_cli_home=os.environ.get("CODEX_CLI_HOME"))
+    try:
+        from .codex_responses import load_codex_auth
+
+        auth = load_codex_auth(codex_cli_home=os.environ.get("CODEX_CLI_HOME"))
+    except Exception as e:
+        return CheckResult("Codex auth", False, required, f"failed to load auth: {e}")
     ok = bool(auth.access_token or auth.api_key)
     detail = "auth ok" if ok else "missing ~/.codex/auth.json tokens (run `codex login`)"
     return CheckResult("Codex auth", ok, required, detail)
@@ -75,7 +83,12 @@ def _check_gemini_creds(*, required: bool) -> CheckResult:
     path = Path(os.environ.get("GEMINI_OAUTH_CREDS_PATH", "~/.gemini/oauth_creds.json")).expanduser()
     if not path.exists():
         return CheckResult("Gemini OAuth cache", False, required, f"missing: {path} (run `gemini auth login`)")
-    creds = load_gemini_creds(path)
+    try:
+        from .gemini_cloudcode import load_gemini_creds
+
+        creds = load_gemini_creds(path)
+    except Exception as e:
+        return CheckResult("Gemini OAuth cache", False, required, f"{path} (load failed: {e})")
     ok = bool(creds.access_token or creds.refresh_token)
     return CheckResult(
         "Gemini OAuth cache",
@@ -95,6 +108,8 @@ async def _check_claude_oauth_refreshable(*, required: bool) -> CheckResult:
             f"missing: {path} (run `uv run python -m codex_gateway.claude_oauth_login`)",
         )
     try:
+        from .claude_oauth import maybe_refresh_claude_oauth
+
         creds = await maybe_refresh_claude_oauth(str(path))
     except Exception as e:
         return CheckResult("Claude OAuth cache", False, required, f"{path} (refresh failed: {e})")
@@ -117,6 +132,8 @@ def _check_workspace_file(*, required: bool) -> CheckResult:
 
 
 async def run_doctor() -> int:
+    import asyncio
+
     # Import config so presets are applied, mirroring the server.
     # This keeps doctor output aligned with what the gateway will actually do.
     from . import config as _config  # noqa: F401
@@ -131,21 +148,6 @@ async def run_doctor() -> int:
     # - claude oauth requires oauth creds; claude-cli mode only requires binary
     # - cursor-agent requires binary (login state isn't reliably detectable)
 
-    codex_bin = _check_binary("codex", "codex", required=(provider == "codex"))
-    codex_auth = _check_codex_auth(required=(provider == "codex"))
-    codex_ready = codex_bin.ok and codex_auth.ok
-
-    gemini_bin = _check_binary("gemini", "gemini", required=(provider == "gemini"))
-    gemini_creds = _check_gemini_creds(required=(provider == "gemini" and gemini_use_cloudcode))
-    gemini_ready = gemini_bin.ok and (gemini_creds.ok if gemini_use_cloudcode else True)
-
-    claude_bin = _check_binary("claude", "claude", required=(provider == "claude" and not claude_use_oauth))
-    claude_oauth = await _check_claude_oauth_refreshable(required=(provider == "claude" and claude_use_oauth))
-    claude_ready = (claude_oauth.ok if claude_use_oauth else claude_bin.ok)
-
-    cursor_bin = _check_binary("cursor-agent", "cursor-agent", required=(provider == "cursor-agent"))
-    cursor_ready = cursor_bin.ok
-
     checks: list[CheckResult] = []
 
     # Surface invalid boolean env values explicitly (avoid silent fallback).
@@ -154,48 +156,67 @@ async def run_doctor() -> int:
     if gemini_use_cloudcode_err:
         checks.append(CheckResult("GEMINI_USE_CLOUDCODE_API", False, False, gemini_use_cloudcode_err))
 
+    # Only run the checks for the selected provider; `auto` runs them all (none required)
+    # and derives readiness from the same results. Checks are independent and I/O-bound
+    # (PATH scans, file reads, OAuth refresh), so they run concurrently; each check reports
+    # its own failures, and gather keeps the declared order.
+    any_ready = True
     if provider == "codex":
-        checks.extend([codex_bin, codex_auth])
+        checks.extend(
+            await asyncio.gather(
+                asyncio.to_thread(_check_binary, "codex", "codex", required=True),
+                asyncio.to_thread(_check_codex_auth, required=True),
+            )
+        )
     elif provider == "gemini":
-        checks.append(gemini_bin)
+        pending = [asyncio.to_thread(_check_binary, "gemini", "gemini", required=True)]
         if gemini_use_cloudcode:
-            checks.append(gemini_creds)
+            pending.append(asyncio.to_thread(_check_gemini_creds, required=True))
+        checks.extend(await asyncio.gather(*pending))
     elif provider == "claude":
         if claude_use_oauth:
-            checks.append(claude_oauth)
-            checks.append(_check_binary("claude", "claude", required=False))
+            checks.extend(
+                await asyncio.gather(
+                    _check_claude_oauth_refreshable(required=True),
+                    asyncio.to_thread(_check_binary, "claude", "claude", required=False),
+                )
+            )
         else:
-            checks.append(claude_bin)
-            checks.append(await _check_claude_oauth_refreshable(required=False))
+            checks.extend(
+                await asyncio.gather(
+                    asyncio.to_thread(_check_binary, "claude", "claude", required=True),
+                    _check_claude_oauth_refreshable(required=False),
+                )
+            )
     elif provider == "cursor-agent":
-        checks.append(cursor_bin)
+        checks.append(_check_binary("cursor-agent", "cursor-agent", required=True))
     else:
-        checks.extend(
-            [
-                _check_binary("codex", "codex", required=False),
-                _check_codex_auth(required=False),
-                _check_binary("gemini", "gemini", required=False),
-                _check_gemini_creds(required=False),
-                _check_binary("claude", "claude", required=False),
-                await _check_claude_oauth_refreshable(required=False),
-                _check_binary("cursor-agent", "cursor-agent", required=False),
-            ]
+        results = await asyncio.gather(
+            asyncio.to_thread(_check_binary, "codex", "codex", required=False),
+            asyncio.to_thread(_check_codex_auth, required=False),
+            asyncio.to_thread(_check_binary, "gemini", "gemini", required=False),
+            asyncio.to_thread(_check_gemini_creds, required=False),
+            asyncio.to_thread(_check_binary, "claude", "claude", required=False),
+            _check_claude_oauth_refreshable(required=False),
+            asyncio.to_thread(_check_binary, "cursor-agent", "cursor-agent", required=False),
         )
+        codex_bin, codex_auth, gemini_bin, gemini_creds, claude_bin, claude_oauth, cursor_bin = results
+        checks.extend(results)
+
+        codex_ready = codex_bin.ok and codex_auth.ok
+        gemini_ready = gemini_bin.ok and (gemini_creds.ok if gemini_use_cloudcode else True)
+        claude_ready = claude_oauth.ok if claude_use_oauth else claude_bin.ok
+        cursor_ready = cursor_bin.ok
+        any_ready = codex_ready or gemini_ready or claude_ready or cursor_ready
 
     if os.environ.get("CODEX_WORKSPACE"):
         checks.append(_check_workspace_file(required=True))
 
-    width = max(len(c.name) for c in checks) if checks else 10
-    print("agent-cli-to-api doctor\n")
-    for c in checks:
-        print(f"- {c.name.ljust(width)} : {_fmt_status(c.ok, required=c.required)}  {c.details}")
-
     required_failed = any((not c.ok) and c.required for c in checks)
     warnings = any((not c.ok) and (not c.required) for c in checks)
 
-    if provider == "auto":
-        if not (codex_ready or gemini_ready or claude_ready or cursor_ready):
-            required_failed = True
+    if not any_ready:
+        required_failed = True
 
     if required_failed:
         result = "FAIL"
@@ -207,11 +228,20 @@ async def run_doctor() -> int:
         result = "OK"
         code = 0
 
-    print(f"\nResult: {result}")
+    # Emit the report as one write so it isn't interleaved with other output.
+    width = max(len(c.name) for c in checks) if checks else 10
+    lines = ["agent-cli-to-api doctor\n\n"]
+    for c in checks:
+        lines.append(f"- {c.name.ljust(width)} : {_fmt_status(c.ok, required=c.required)}  {c.details}\n")
+    lines.append(f"\nResult: {result}\n")
+    sys.stdout.write("".join(lines))
+    sys.stdout.flush()
     return code
 
 
 def main(argv: list[str] | None = None) -> None:
+    import asyncio
+
     _ = argv
     raise SystemExit(asyncio.run(run_doctor()))
 
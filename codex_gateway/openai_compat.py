@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+from itertools import chain
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+_IMAGE_TYPES: frozenset[str] = frozenset({"image_url", "input_image"})
+# Prompt labels for every `ChatMessage.role` value (validated as a Literal, so lookups can't miss).
+_ROLE_UPPER: dict[str, str] = {
+    "system": "SYSTEM",
+    "user": "USER",
+    "assistant": "ASSISTANT",
+    "tool": "TOOL",
+    "developer": "DEVELOPER",
+}
+
 
 class ChatMessage(BaseModel):
     role: Literal["system", "user", "assistant", "tool", "developer"]
+    # Kept as `Any`: its validator is a pass-through, and content shapes vary across clients.
     content: Any
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ChatCompletionRequest(BaseModel):
     model: str | None = None
@@ -17,26 +31,35 @@ class ChatCompletionRequest(BaseModel):
     max_tokens: int | None = None
 
     # Accept extra fields from clients (temperature, etc.).
-    model_config = ConfigDict(extra="allow")
+    # Validators are built on first use rather than at import; the server pre-warms at startup.
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 class ErrorResponse(BaseModel):
     error: dict[str, Any] = Field(default_factory=dict)
 
 
+def _join_text_parts(content: list[Any]) -> str:
+    return "".join(
+        part["text"]
+        for part in content
+        if isinstance(part, dict) and part.get("type") == "text" and isinstance(part.get("text"), str)
+    )
+
+
 def normalize_message_content(content: Any) -> str:
+    # Exact-type fast paths: JSON-decoded content is a plain str (most messages) or list.
+    content_type = type(content)
+    if content_type is str:
+        return content
+    if content_type is list:
+        return _join_text_parts(content)
     if content is None:
         return ""
     if isinstance(content, str):
         return content
     if isinstance(content, list):
-        parts: list[str] = []
-        for part in content:
-            if not isinstance(part, dict):
-                continue
-            if part.get("type") == "text" and isinstance(part.get("text"), str):
-                parts.append(part["text"])
-        return "".join(parts)
+        return _join_text_parts(content)
     if isinstance(content, dict):
         if content.get("type") == "text" and isinstance(content.get("text"), str):
             return content["text"]
@@ -46,7 +69,7 @@ def normalize_message_content(content: Any) -> str:
 def messages_to_prompt(messages: list[ChatMessage]) -> str:
     parts: list[str] = []
     for message in messages:
-        role = message.role.upper()
+        role = _ROLE_UPPER[message.role]
         text = normalize_message_content(message.content)
         parts.append(f"{role}: {text}")
     return "\n\n".join(parts).strip()
@@ -60,7 +83,7 @@ def extract_image_urls_from_content(content: Any) -> list[str]:
     # Accept single-part formats in addition to the OpenAI list-of-parts format.
     if isinstance(content, dict):
         part_type = content.get("type")
-        if part_type in {"image_url", "input_image"}:
+        if part_type in _IMAGE_TYPES:
             image = content.get("image_url")
             if isinstance(image, dict):
                 url = image.get("url")
@@ -77,7 +100,7 @@ def extract_image_urls_from_content(content: Any) -> list[str]:
         if not isinstance(part, dict):
             continue
         part_type = part.get("type")
-        if part_type not in {"image_url", "input_image"}:
+        if part_type not in _IMAGE_TYPES:
             continue
         image = part.get("image_url")
         if isinstance(image, dict):
@@ -91,7 +114,40 @@ def extract_image_urls_from_content(content: Any) -> list[str]:
 
 
 def extract_image_urls(messages: list[ChatMessage]) -> list[str]:
+    return list(chain.from_iterable(extract_image_urls_from_content(message.content) for message in messages))
+
+
+def messages_to_prompt_and_image_urls(messages: list[ChatMessage]) -> tuple[str, list[str]]:
+    """
+    Equivalent to `(messages_to_prompt(messages), extract_image_urls(messages))`, but walks
+    each message's content only once.
+    """
+    parts: list[str] = []
     urls: list[str] = []
     for message in messages:
-        urls.extend(extract_image_urls_from_content(message.content))
-    return urls
+        role = _ROLE_UPPER[message.role]
+        content = message.content
+        if isinstance(content, list):
+            texts: list[str] = []
+            for part in content:
+                if not isinstance(part, dict):
+                    continue
+                part_type = part.get("type")
+                if part_type == "text":
+                    if isinstance(part.get("text"), str):
+                        texts.append(part["text"])
+                elif part_type in _IMAGE_TYPES:
+                    image = part.get("image_url")
+                    if isinstance(image, dict):
+                        url = image.get("url")
+                        if isinstance(url, str) and url:
+                            urls.append(url)
+                    elif isinstance(image, str) and image:
+                        urls.append(image)
+            text = "".join(texts)
+        else:
+            text = normalize_message_content(content)
+            if isinstance(content, dict):
+                urls.extend(extract_image_urls_from_content(content))
+        parts.append(f"{role}: {text}")
+    return "\n\n".join(parts).strip(), urls
@@ -44,8 +44,8 @@ from .openai_compat import (
     ErrorResponse,
     ResponsesRequest,
     compat_chat_request_to_chat_request,
-    extract_image_urls,
     messages_to_prompt,
+    messages_to_prompt_and_image_urls,
     normalize_message_content,
     responses_request_to_chat_request,
 )
@@ -421,6 +421,7 @@ def _format_request_metadata(
     reasoning_effort: str,
     effort_source: str,
     request_effort_raw: str | None,
+    image_urls: list[str],
 ) -> tuple[str, str]:
     items: list[tuple[str, str]] = []
     client_model = (req.model or "").strip() or "<default>"
@@ -446,7 +447,7 @@ def _format_request_metadata(
         msg_summary += f" other={counts['other']}"
     items.append(("messages", msg_summary))
 
-    image_count = len(extract_image_urls(req.messages))
+    image_count = len(image_urls)
     if image_count:
         items.append(("images", str(image_count)))
 
@@ -893,12 +894,11 @@ def _decode_data_url(data_url: str) -> tuple[bytes, str]:
 
 
 def _materialize_request_images(
-    req: ChatCompletionRequest, *, resp_id: str
+    urls: list[str], *, resp_id: str
 ) -> tuple[tempfile.TemporaryDirectory | None, list[str]]:
     if not settings.enable_image_input:
         return None, []
 
-    urls = extract_image_urls(req.messages)
     if not urls:
         return None, []
 
@@ -1020,6 +1020,10 @@ async def _log_startup_config() -> None:
 async def _warmup_caches() -> None:
     """Pre-warm OAuth/project caches at startup to reduce first-request latency."""
     provider = _normalize_provider(settings.provider)
+
+    # Build the deferred request validators now instead of on the first request.
+    ChatMessage.model_rebuild()
+    ChatCompletionRequest.model_rebuild()
     
     # Ensure cursor-agent workspace exists
     if provider == "cursor-agent" and settings.cursor_agent_workspace:
@@ -1207,7 +1211,8 @@ async def chat_completions(
     # Final effort is always normalized to a supported value.
     reasoning_effort = forced_effort or request_effort or default_effort or "high"
     # Some providers take a single prompt string; Codex backend uses structured messages.
-    prompt = _maybe_inject_automation_guard(messages_to_prompt(req.messages))
+    prompt, image_urls = messages_to_prompt_and_image_urls(req.messages)
+    prompt = _maybe_inject_automation_guard(prompt)
     if len(prompt) > settings.max_prompt_chars:
         return _openai_error(f"Prompt too large ({len(prompt)} chars)", status_code=413)
 
@@ -1215,7 +1220,6 @@ async def chat_completions(
     resp_id = f"chatcmpl-{uuid.uuid4().hex}"
     t0 = time.time()
 
-    image_urls = extract_image_urls(req.messages)
     use_claude_oauth = bool(provider == "claude" and settings.claude_use_oauth_api)
     use_gemini_cloudcode = bool(provider == "gemini" and settings.gemini_use_cloudcode_api)
     use_codex_backend = bool(
@@ -1274,6 +1278,7 @@ async def chat_completions(
             reasoning_effort=reasoning_effort,
             effort_source=effort_source,
             request_effort_raw=request_effort_raw,
+            image_urls=image_urls,
         )
         if settings.log_render_markdown:
             _maybe_print_markdown(resp_id, "REQUEST PARAMS", req_meta_md)
@@ -1341,7 +1346,7 @@ async def chat_completions(
                     logger.info("[%s] decoded_images=%d", resp_id, len(image_urls))
             else:
                 try:
-                    tmpdir, image_files = _materialize_request_images(req, resp_id=resp_id)
+                    tmpdir, image_files = _materialize_request_images(image_urls, resp_id=resp_id)
                 except HTTPException:
                     raise
                 except Exception as e: